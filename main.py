@@ -4,12 +4,57 @@
 import sys
 
 
+INGEST_USAGE = "Verwendung: python main.py ingest <pfad> [-f|--force] [--collection <name>]"
+CHAT_USAGE = "Verwendung: python main.py chat [--collection <name>[,<name>...]]"
+
+
+def _parse_collections(args: list[str], usage: str) -> tuple[list[str], list[str]]:
+    """Split `--collection` values out of args; returns (collections, rest)."""
+    collections = []
+    rest = []
+    i = 0
+    while i < len(args):
+        if args[i] == "--collection":
+            if i + 1 >= len(args):
+                print(f"Fehler: {args[i]} erwartet einen Namen")
+                print(usage)
+                sys.exit(1)
+            collections.extend(name.strip() for name in args[i + 1].split(",") if name.strip())
+            i += 2
+        else:
+            rest.append(args[i])
+            i += 1
+    return collections, rest
+
+
+def _validate_collections(collections: list[str]):
+    from src.db import validate_collection
+
+    try:
+        for collection in collections:
+            validate_collection(collection)
+    except ValueError as e:
+        print(f"Fehler: {e}")
+        sys.exit(1)
+
+
+def _require_collections(collections: list[str]):
+    """Exit with an error if any collection has not been ingested yet."""
+    from src.db import missing_collections
+
+    missing = missing_collections(collections)
+    if missing:
+        print(f"Fehler: Unbekannte Collection(s): {', '.join(missing)}")
+        print("Collections entstehen mit: python main.py ingest <pfad> --collection <name>")
+        sys.exit(1)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Verwendung:")
         print("  python main.py init-db          - Datenbank initialisieren")
-        print("  python main.py ingest <pfad> [-f|--force] - PDFs ingestieren")
-        print("  python main.py chat             - Chat starten")
+        print("  python main.py ingest <pfad> [-f|--force] [--collection <name>] - PDFs ingestieren")
+        print("  python main.py chat [--collection <name>[,<name>...]] - Chat starten")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -19,27 +64,54 @@ def main():
         init_db()
 
     elif command == "ingest":
-        if len(sys.argv) < 3:
-            print("Fehler: Pfad zum PDF-Ordner fehlt")
-            print("Verwendung: python main.py ingest <pfad> [-f|--force]")
-            sys.exit(1)
-
-        from src.ingest import ingest_directory
+        collections, args = _parse_collections(sys.argv[2:], INGEST_USAGE)
 
         force = False
-        if len(sys.argv) >= 4:
-            if sys.argv[3] in ("-f", "--force"):
+        paths = []
+        for arg in args:
+            if arg in ("-f", "--force"):
                 force = True
-            else:
-                print(f"Unbekannte Option: {sys.argv[3]}")
-                print("Verwendung: python main.py ingest <pfad> [-f|--force]")
+            elif arg.startswith("-"):
+                print(f"Unbekannte Option: {arg}")
+                print(INGEST_USAGE)
                 sys.exit(1)
+            else:
+                paths.append(arg)
+
+        if not paths:
+            print("Fehler: Pfad zum PDF-Ordner fehlt")
+            print(INGEST_USAGE)
+            sys.exit(1)
 
-        ingest_directory(sys.argv[2], force=force)
+        if len(paths) > 1:
+            print(f"Fehler: Genau ein Pfad erwartet, erhalten: {' '.join(paths)}")
+            print(INGEST_USAGE)
+            sys.exit(1)
+
+        if len(collections) > 1:
+            print("Fehler: ingest schreibt in genau eine Collection")
+            print(INGEST_USAGE)
+            sys.exit(1)
+        _validate_collections(collections)
+
+        from src.ingest import ingest_directory
+        ingest_directory(paths[0], force=force, collection=collections[0] if collections else None)
 
     elif command == "chat":
+        collections, args = _parse_collections(sys.argv[2:], CHAT_USAGE)
+
+        if args:
+            print(f"Unbekannte Option: {args[0]}")
+            print(CHAT_USAGE)
+            sys.exit(1)
+        from src.config import config
+
+        collections = list(dict.fromkeys(collections)) or [config.DEFAULT_COLLECTION]
+        _validate_collections(collections)
+        _require_collections(collections)
+
         from src.chat import chat_loop
-        chat_loop()
+        chat_loop(collections=collections)
 
     else:
         print(f"Unbekannter Befehl: {command}")
@@ -48,4 +120,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        from src.clients import close_clients
+        close_clients()
@@ -1,10 +1,6 @@
-from openai import OpenAI
-
+from .clients import get_openai_client
 from .config import config
-from .retriever import retrieve, format_context
-
-
-openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+from .retriever import retrieve, format_context, source_name
 
 PROMPT_IDENTITY = """Du bist ein hilfreicher Assistent fuer technische Datenblaetter.
 Beantworte Fragen ausschliesslich basierend auf den bereitgestellten Dokumentauszuegen."""
@@ -59,11 +55,11 @@ def _build_user_prompt(context: str, query: str) -> str:
     )
 
 
-def _collect_sources(results: list[dict], max_sources: int) -> str:
+def _collect_sources(results: list[dict], max_sources: int, show_collection: bool = False) -> str:
     """Collect unique source labels from retrieval results."""
     sources = set()
     for result in results[:max_sources]:
-        source = result["filename"]
+        source = source_name(result, show_collection)
         if result.get("page_number"):
             source += f" (S. {result['page_number']})"
         sources.add(source)
@@ -73,15 +69,21 @@ def _collect_sources(results: list[dict], max_sources: int) -> str:
 SYSTEM_PROMPT = _build_system_prompt()
 
 
-def chat_response(query: str, history: list[dict] | None = None, show_sources: bool = True) -> str:
+def chat_response(
+    query: str,
+    history: list[dict] | None = None,
+    show_sources: bool = True,
+    collections: list[str] | None = None,
+) -> str:
     """Generate a response for a user query, keeping optional history."""
     history = history or []
-    results = retrieve(query)
+    results = retrieve(query, collections=collections)
 
     if not results:
         return "Keine relevanten Informationen in den Dokumenten gefunden."
 
-    context = format_context(results)
+    show_collection = len(set(collections or [])) > 1
+    context = format_context(results, show_collection=show_collection)
 
     messages = [{"role": "system", "content": SYSTEM_PROMPT}, *history]
     messages.append(
@@ -91,7 +93,7 @@ def chat_response(query: str, history: list[dict] | None = None, show_sources: b
         }
     )
 
-    response = openai_client.chat.completions.create(
+    response = get_openai_client().chat.completions.create(
         model=config.LLM_MODEL,
         messages=messages,
         temperature=0.1
@@ -100,15 +102,18 @@ def chat_response(query: str, history: list[dict] | None = None, show_sources: b
     answer = response.choices[0].message.content or "Keine Antwort vom Modell erhalten."
 
     if show_sources:
-        sources = _collect_sources(results, config.FINAL_EVIDENCE)
+        sources = _collect_sources(results, config.FINAL_EVIDENCE, show_collection=show_collection)
         answer += f"\n\n---\nQuellen: {sources}"
 
     return answer
 
 
-def chat_loop():
-    """Interactive chat loop."""
+def chat_loop(collections: list[str] | None = None):
+    """Interactive chat loop scoped to the given collections."""
+    collections = collections or [config.DEFAULT_COLLECTION]
+
     print("RAG Chat - Technische Datenblaetter")
+    print(f"Collections: {', '.join(collections)}")
     print("Tippe 'exit' oder 'quit' zum Beenden")
     print("-" * 40)
     print()
@@ -133,7 +138,7 @@ def chat_loop():
         print("Assistent:", end=" ")
 
         try:
-            response = chat_response(query, history=history)
+            response = chat_response(query, history=history, collections=collections)
             print(response)
             # keep short running history so follow-up questions have context
             history.append({"role": "user", "content": query})
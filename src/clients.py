@@ -0,0 +1,85 @@
+"""Lazily constructed API clients shared across the pipeline.
+
+Clients are built on first use and cached, so CLI commands only pay for the
+SDKs they actually need. All OpenAI calls go through one client backed by a
+single keep-alive HTTP connection pool.
+"""
+
+import threading
+
+from .config import config
+
+
+_lock = threading.Lock()
+_clients: dict = {}
+
+
+def _get_or_create(name: str, factory):
+    """Return the cached client `name`, building it with `factory` once."""
+    client = _clients.get(name)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(name)
+        if client is None:
+            client = factory()
+            _clients[name] = client
+    return client
+
+
+def _build_http_client():
+    import httpx
+    from openai import DefaultHttpxClient
+
+    # DefaultHttpxClient keeps the SDK's timeout and redirect defaults.
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE,
+        ),
+    )
+
+
+def _build_openai_client(http_client):
+    from openai import OpenAI
+
+    return OpenAI(api_key=config.OPENAI_API_KEY, http_client=http_client)
+
+
+def _build_llama_parser():
+    from llama_parse import LlamaParse
+
+    return LlamaParse(
+        api_key=config.LLAMA_CLOUD_API_KEY,
+        result_type="markdown",
+        skip_diagonal_text=True,
+        do_not_unroll_columns=False,
+    )
+
+
+def get_http_client():
+    """Shared keep-alive HTTP connection pool."""
+    return _get_or_create("http", _build_http_client)
+
+
+def get_openai_client():
+    """Shared OpenAI client used for embeddings and chat completions."""
+    # Resolve the pool before taking the registry lock for the OpenAI client;
+    # the lock is not reentrant.
+    http_client = get_http_client()
+    return _get_or_create("openai", lambda: _build_openai_client(http_client))
+
+
+def get_llama_parser():
+    """Shared LlamaParse instance for PDF parsing."""
+    return _get_or_create("llama_parse", _build_llama_parser)
+
+
+def close_clients():
+    """Close the shared connection pool and forget all cached clients."""
+    with _lock:
+        http_client = _clients.pop("http", None)
+        _clients.clear()
+    if http_client is not None:
+        http_client.close()
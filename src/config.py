@@ -1,24 +1,64 @@
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+
+_env_loaded = False
+
+
+def _load_env():
+    """Load .env once, on first config access instead of at import."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+
+
+class _env:
+    """Setting read from the environment on first access, then cached.
+
+    Non-data descriptor: the cached value lives in the instance __dict__, so
+    settings can still be overridden by plain assignment.
+    """
+
+    def __init__(self, name: str, default: str, cast=str):
+        self.name = name
+        self.default = default
+        self.cast = cast
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        _load_env()
+        value = self.cast(os.getenv(self.name, self.default))
+        instance.__dict__[self.attr] = value
+        return value
 
 
 class Config:
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://localhost:5432/pdf_rag")
+    DATABASE_URL: str = _env("DATABASE_URL", "postgresql://localhost:5432/pdf_rag")
+
+    OPENAI_API_KEY: str = _env("OPENAI_API_KEY", "")
+    LLAMA_CLOUD_API_KEY: str = _env("LLAMA_CLOUD_API_KEY", "")
+
+    EMBEDDING_MODEL: str = _env("EMBEDDING_MODEL", "text-embedding-3-small")
+    EMBEDDING_DIMS: int = _env("EMBEDDING_DIMS", "1536", int)
 
-    OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    LLAMA_CLOUD_API_KEY: str = os.getenv("LLAMA_CLOUD_API_KEY", "")
+    LLM_MODEL: str = _env("LLM_MODEL", "gpt-4o-mini")
 
-    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-    EMBEDDING_DIMS: int = int(os.getenv("EMBEDDING_DIMS", "1536"))
+    DATA_DIR: str = _env("DATA_DIR", "./data")
 
-    LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
+    HTTP_MAX_CONNECTIONS: int = _env("HTTP_MAX_CONNECTIONS", "20", int)
+    HTTP_MAX_KEEPALIVE: int = _env("HTTP_MAX_KEEPALIVE", "10", int)
 
-    DATA_DIR: str = os.getenv("DATA_DIR", "./data")
+    DEFAULT_COLLECTION: str = _env("DEFAULT_COLLECTION", "default")
+    SEARCH_WORKERS: int = _env("SEARCH_WORKERS", "8", int)
 
-    TOPK_VEC: int = int(os.getenv("TOPK_VEC", "20"))
-    FINAL_EVIDENCE: int = int(os.getenv("FINAL_EVIDENCE", "8"))
+    TOPK_VEC: int = _env("TOPK_VEC", "20", int)
+    FINAL_EVIDENCE: int = _env("FINAL_EVIDENCE", "8", int)
 
     CHUNK_SIZE: int = 500
     CHUNK_OVERLAP: int = 50
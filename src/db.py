@@ -1,11 +1,15 @@
-import psycopg2
-from psycopg2.extras import execute_values
-from pgvector.psycopg2 import register_vector
+import re
 
 from .config import config
 
 
+COLLECTION_NAME_RE = re.compile(r"^[a-z][a-z0-9_]{0,39}$")
+
+
 def get_connection():
+    import psycopg2
+    from pgvector.psycopg2 import register_vector
+
     conn = psycopg2.connect(config.DATABASE_URL)
     register_vector(conn)
     return conn
@@ -24,52 +28,127 @@ def init_db():
     cur.execute("""
         CREATE TABLE IF NOT EXISTS documents (
             id SERIAL PRIMARY KEY,
-            filename TEXT NOT NULL UNIQUE,
-            created_at TIMESTAMP DEFAULT NOW()
+            collection TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT NOW(),
+            UNIQUE (collection, filename),
+            UNIQUE (id, collection)
         )
     """)
 
+    # Chunks are list-partitioned by collection; every partition gets its own
+    # HNSW index (see ensure_collection), so index size and query cost scale
+    # with the collection instead of the whole corpus.
     cur.execute(f"""
         CREATE TABLE IF NOT EXISTS chunks (
-            id SERIAL PRIMARY KEY,
-            document_id INTEGER REFERENCES documents(id) ON DELETE CASCADE,
+            id SERIAL,
+            collection TEXT NOT NULL,
+            document_id INTEGER NOT NULL,
             content TEXT NOT NULL,
             embedding vector({config.EMBEDDING_DIMS}),
             page_number INTEGER,
             chunk_index INTEGER,
-            created_at TIMESTAMP DEFAULT NOW()
-        )
-    """)
-
-    cur.execute("""
-        CREATE INDEX IF NOT EXISTS chunks_embedding_idx
-        ON chunks USING hnsw (embedding vector_cosine_ops)
+            created_at TIMESTAMP DEFAULT NOW(),
+            PRIMARY KEY (collection, id),
+            FOREIGN KEY (document_id, collection)
+                REFERENCES documents(id, collection) ON DELETE CASCADE
+        ) PARTITION BY LIST (collection)
     """)
 
     conn.commit()
     cur.close()
     conn.close()
+
+    ensure_collection(config.DEFAULT_COLLECTION)
     print("Database initialized successfully.")
 
 
-def insert_document(filename: str) -> int:
+def validate_collection(name: str) -> str:
+    """Return `name` if it is usable as a collection, else raise ValueError."""
+    if not COLLECTION_NAME_RE.match(name):
+        raise ValueError(
+            f"Ungueltiger Collection-Name: {name!r} "
+            "(erlaubt: a-z, 0-9, _; max. 40 Zeichen, beginnt mit Buchstabe)"
+        )
+    return name
+
+
+def _partition_name(collection: str) -> str:
+    return f"chunks_{validate_collection(collection)}"
+
+
+def collection_ddl(collection: str) -> list[str]:
+    """SQL statements creating the chunks partition and HNSW index for `collection`.
+
+    The name is checked against COLLECTION_NAME_RE, which only admits
+    characters that are safe both as an identifier and inside a string literal.
+    """
+    partition = _partition_name(collection)
+    return [
+        f"CREATE TABLE IF NOT EXISTS {partition} "
+        f"PARTITION OF chunks FOR VALUES IN ('{collection}')",
+        f"CREATE INDEX IF NOT EXISTS {partition}_embedding_idx "
+        f"ON {partition} USING hnsw (embedding vector_cosine_ops)",
+    ]
+
+
+def ensure_collection(collection: str):
+    """Create the chunks partition and its HNSW index for `collection`."""
+    statements = collection_ddl(collection)
+
+    conn = get_connection()
+    cur = conn.cursor()
+
+    for statement in statements:
+        cur.execute(statement)
+
+    conn.commit()
+    cur.close()
+    conn.close()
+
+
+def missing_collections(collections: list[str]) -> list[str]:
+    """Return the collections in `collections` that have no chunks partition."""
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits i
+        JOIN pg_class parent ON i.inhparent = parent.oid
+        JOIN pg_class child ON i.inhrelid = child.oid
+        WHERE parent.relname = 'chunks'
+        """
+    )
+    partitions = {row[0] for row in cur.fetchall()}
+
+    cur.close()
+    conn.close()
+    return [c for c in collections if _partition_name(c) not in partitions]
+
+
+def insert_document(filename: str, collection: str) -> int:
     conn = get_connection()
     cur = conn.cursor()
 
     cur.execute(
-        "SELECT id FROM documents WHERE filename = %s",
-        (filename,)
+        "SELECT id FROM documents WHERE collection = %s AND filename = %s",
+        (collection, filename)
     )
     row = cur.fetchone()
 
     if row:
         doc_id = row[0]
-        cur.execute("DELETE FROM chunks WHERE document_id = %s", (doc_id,))
+        cur.execute(
+            "DELETE FROM chunks WHERE collection = %s AND document_id = %s",
+            (collection, doc_id)
+        )
         conn.commit()
     else:
         cur.execute(
-            "INSERT INTO documents (filename) VALUES (%s) RETURNING id",
-            (filename,)
+            "INSERT INTO documents (collection, filename) VALUES (%s, %s) RETURNING id",
+            (collection, filename)
         )
         doc_id = cur.fetchone()[0]
         conn.commit()
@@ -79,14 +158,14 @@ def insert_document(filename: str) -> int:
     return doc_id
 
 
-def document_exists(filename: str) -> bool:
-    """Check if a document with the given filename already exists."""
+def document_exists(filename: str, collection: str) -> bool:
+    """Check if a document with the given filename already exists in a collection."""
     conn = get_connection()
     cur = conn.cursor()
 
     cur.execute(
-        "SELECT id FROM documents WHERE filename = %s",
-        (filename,)
+        "SELECT id FROM documents WHERE collection = %s AND filename = %s",
+        (collection, filename)
     )
     exists = cur.fetchone() is not None
 
@@ -95,12 +174,15 @@ def document_exists(filename: str) -> bool:
     return exists
 
 
-def insert_chunks(document_id: int, chunks: list[dict]):
+def insert_chunks(document_id: int, chunks: list[dict], collection: str):
+    from psycopg2.extras import execute_values
+
     conn = get_connection()
     cur = conn.cursor()
 
     data = [
         (
+            collection,
             document_id,
             chunk["content"],
             chunk["embedding"],
@@ -113,11 +195,11 @@ def insert_chunks(document_id: int, chunks: list[dict]):
     execute_values(
         cur,
         """
-        INSERT INTO chunks (document_id, content, embedding, page_number, chunk_index)
+        INSERT INTO chunks (collection, document_id, content, embedding, page_number, chunk_index)
         VALUES %s
         """,
         data,
-        template="(%s, %s, %s::vector, %s, %s)"
+        template="(%s, %s, %s, %s::vector, %s, %s)"
     )
 
     conn.commit()
@@ -125,7 +207,12 @@ def insert_chunks(document_id: int, chunks: list[dict]):
     conn.close()
 
 
-def search_similar(query_embedding: list[float], top_k: int = 20) -> list[dict]:
+def search_similar(query_embedding: list[float], collection: str, top_k: int = 20) -> list[dict]:
+    """Nearest-neighbour search within a single collection.
+
+    Filtering on the partition key lets Postgres prune to that collection's
+    partition and use its HNSW index.
+    """
     conn = get_connection()
     cur = conn.cursor()
 
@@ -138,10 +225,11 @@ def search_similar(query_embedding: list[float], top_k: int = 20) -> list[dict]:
             1 - (c.embedding <=> %s::vector) as similarity
         FROM chunks c
         JOIN documents d ON c.document_id = d.id
+        WHERE c.collection = %s
         ORDER BY c.embedding <=> %s::vector
         LIMIT %s
         """,
-        (query_embedding, query_embedding, top_k)
+        (query_embedding, collection, query_embedding, top_k)
     )
 
     results = []
@@ -150,7 +238,8 @@ def search_similar(query_embedding: list[float], top_k: int = 20) -> list[dict]:
             "content": row[0],
             "page_number": row[1],
             "filename": row[2],
-            "similarity": row[3]
+            "similarity": row[3],
+            "collection": collection
         })
 
     cur.close()
@@ -1,27 +1,16 @@
 import os
 from pathlib import Path
 
-from llama_parse import LlamaParse
-from openai import OpenAI
-
+from .clients import get_llama_parser, get_openai_client
 from .config import config
-from .db import document_exists, insert_document, insert_chunks
-
-
-parser = LlamaParse(
-    api_key=config.LLAMA_CLOUD_API_KEY,
-    result_type="markdown",
-    skip_diagonal_text=True,
-    do_not_unroll_columns=False,
-)
-openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+from .db import document_exists, ensure_collection, insert_document, insert_chunks, validate_collection
 
 
 def parse_pdf(file_path: str) -> list[dict]:
     """Parse PDF using LlamaParse and return pages with text."""
     print(f"  Parsing with LlamaParse...")
 
-    documents = parser.load_data(file_path)
+    documents = get_llama_parser().load_data(file_path)
 
     pages = []
     for i, doc in enumerate(documents):
@@ -57,7 +46,7 @@ def get_embeddings(texts: list[str]) -> list[list[float]]:
     if not texts:
         return []
 
-    response = openai_client.embeddings.create(
+    response = get_openai_client().embeddings.create(
         model=config.EMBEDDING_MODEL,
         input=texts
     )
@@ -65,12 +54,12 @@ def get_embeddings(texts: list[str]) -> list[list[float]]:
     return [item.embedding for item in response.data]
 
 
-def ingest_pdf(file_path: str, force: bool = False):
-    """Ingest a single PDF file into the database."""
+def ingest_pdf(file_path: str, collection: str, force: bool = False):
+    """Ingest a single PDF file into a collection."""
     filename = os.path.basename(file_path)
     print(f"Processing: {filename}")
 
-    if not force and document_exists(filename):
+    if not force and document_exists(filename, collection):
         print(f"  Already exists in database, skipping...")
         return
 
@@ -103,14 +92,15 @@ def ingest_pdf(file_path: str, force: bool = False):
     for i, emb in enumerate(embeddings):
         all_chunks[i]["embedding"] = emb
 
-    doc_id = insert_document(filename)
-    insert_chunks(doc_id, all_chunks)
+    doc_id = insert_document(filename, collection)
+    insert_chunks(doc_id, all_chunks, collection)
 
     print(f"  Stored {len(all_chunks)} chunks in database")
 
 
-def ingest_directory(directory: str, force: bool = False):
-    """Ingest all PDF files from a directory."""
+def ingest_directory(directory: str, force: bool = False, collection: str | None = None):
+    """Ingest all PDF files from a directory into a collection."""
+    collection = validate_collection(collection or config.DEFAULT_COLLECTION)
     path = Path(directory)
 
     if not path.exists():
@@ -124,12 +114,15 @@ def ingest_directory(directory: str, force: bool = False):
         return
 
     print(f"Found {len(pdf_files)} PDF file(s)")
+    print(f"Collection: {collection}")
     if force:
         print("Force mode: re-ingesting all files")
     print()
 
+    ensure_collection(collection)
+
     for pdf_file in pdf_files:
-        ingest_pdf(str(pdf_file), force=force)
+        ingest_pdf(str(pdf_file), collection, force=force)
         print()
 
     print("Ingestion complete!")
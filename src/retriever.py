@@ -1,33 +1,62 @@
-from openai import OpenAI
+from concurrent.futures import ThreadPoolExecutor
 
+from .clients import get_openai_client
 from .config import config
-from .db import search_similar
-
-
-openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+from .db import search_similar, validate_collection
 
 
 def get_query_embedding(query: str) -> list[float]:
     """Get embedding for a query string."""
-    response = openai_client.embeddings.create(
+    response = get_openai_client().embeddings.create(
         model=config.EMBEDDING_MODEL,
         input=query
     )
     return response.data[0].embedding
 
 
-def retrieve(query: str, top_k: int = None) -> list[dict]:
-    """Retrieve relevant chunks for a query."""
+def search_collections(query_embedding: list[float], collections: list[str], top_k: int) -> list[dict]:
+    """Search each collection in parallel and merge the hits by similarity."""
+    if len(collections) == 1:
+        return search_similar(query_embedding, collections[0], top_k=top_k)
+
+    workers = max(1, min(len(collections), config.SEARCH_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        per_collection = pool.map(
+            lambda collection: search_similar(query_embedding, collection, top_k=top_k),
+            collections,
+        )
+        merged = [result for results in per_collection for result in results]
+
+    merged.sort(key=lambda result: result["similarity"], reverse=True)
+    return merged[:top_k]
+
+
+def retrieve(query: str, top_k: int = None, collections: list[str] | None = None) -> list[dict]:
+    """Retrieve relevant chunks for a query from one or more collections."""
     if top_k is None:
         top_k = config.TOPK_VEC
+    if not collections:
+        collections = [config.DEFAULT_COLLECTION]
+    collections = [validate_collection(c) for c in dict.fromkeys(collections)]
 
     query_embedding = get_query_embedding(query)
-    results = search_similar(query_embedding, top_k=top_k)
+    results = search_collections(query_embedding, collections, top_k=top_k)
 
     return results
 
 
-def format_context(results: list[dict], max_chunks: int = None) -> str:
+def source_name(result: dict, show_collection: bool = False) -> str:
+    """Filename of a hit, prefixed with its collection when several are searched.
+
+    Filenames are only unique within a collection, so multi-collection answers
+    need the prefix to tell same-named documents apart.
+    """
+    if show_collection and result.get("collection"):
+        return f"{result['collection']}/{result['filename']}"
+    return result["filename"]
+
+
+def format_context(results: list[dict], max_chunks: int = None, show_collection: bool = False) -> str:
     """Format retrieved chunks as context for the LLM."""
     if max_chunks is None:
         max_chunks = config.FINAL_EVIDENCE
@@ -35,7 +64,7 @@ def format_context(results: list[dict], max_chunks: int = None) -> str:
     context_parts = []
 
     for i, result in enumerate(results[:max_chunks]):
-        source = f"{result['filename']}"
+        source = source_name(result, show_collection)
         if result.get("page_number"):
             source += f", Seite {result['page_number']}"
 
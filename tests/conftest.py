@@ -0,0 +1,14 @@
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def dotenv_stub():
+    """Stub python-dotenv for each test so config can be read offline."""
+    fake_dotenv = types.ModuleType("dotenv")
+    fake_dotenv.load_dotenv = lambda *args, **kwargs: None
+    with patch.dict(sys.modules, {"dotenv": fake_dotenv}):
+        yield fake_dotenv
@@ -89,6 +89,15 @@ class ChatPromptTests(unittest.TestCase):
         sources = chat._collect_sources(results, max_sources=8)
         self.assertEqual(sources, "A.pdf, B.pdf (S. 2)")
 
+    def test_collect_sources_keeps_same_filename_from_different_collections_apart(self):
+        results = [
+            {"filename": "A.pdf", "page_number": 1, "collection": "parkett"},
+            {"filename": "A.pdf", "page_number": 1, "collection": "fliesen"},
+        ]
+
+        sources = chat._collect_sources(results, max_sources=8, show_collection=True)
+        self.assertEqual(sources, "fliesen/A.pdf (S. 1), parkett/A.pdf (S. 1)")
+
     def test_chat_response_returns_not_found_message_when_no_results(self):
         with patch("src.chat.retrieve", return_value=[]):
             response = chat.chat_response("Unbekannte Frage")
@@ -114,7 +123,7 @@ class ChatPromptTests(unittest.TestCase):
         with patch("src.chat.retrieve", return_value=results), patch(
             "src.chat.format_context",
             return_value="[Quelle 1: TKB-01.pdf, Seite 3]\nBeispiel",
-        ), patch("src.chat.openai_client", fake_client):
+        ), patch("src.chat.get_openai_client", return_value=fake_client):
             response = chat.chat_response("Welche Spachtelmasse fuer Mosaikparkett?")
 
         call_kwargs = create_mock.call_args.kwargs
@@ -126,5 +135,23 @@ class ChatPromptTests(unittest.TestCase):
         self.assertTrue(response.endswith("Quellen: TKB-01.pdf (S. 3)"))
 
 
+    def test_chat_response_scopes_retrieval_and_labels_to_collections(self):
+        llm_response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Antwort [Quelle 1]."))]
+        )
+        fake_client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=Mock(return_value=llm_response)))
+        )
+        results = [{"filename": "A.pdf", "page_number": 1, "content": "Text", "collection": "parkett"}]
+
+        with patch("src.chat.retrieve", return_value=results) as retrieve_mock, patch(
+            "src.chat.format_context", return_value="Kontext"
+        ) as format_mock, patch("src.chat.get_openai_client", return_value=fake_client):
+            response = chat.chat_response("Frage", collections=["parkett", "fliesen"])
+
+        retrieve_mock.assert_called_once_with("Frage", collections=["parkett", "fliesen"])
+        format_mock.assert_called_once_with(results, show_collection=True)
+        self.assertTrue(response.endswith("Quellen: parkett/A.pdf (S. 1)"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,68 @@
+import importlib
+import sys
+import types
+import unittest
+from unittest.mock import Mock, patch
+
+
+clients = importlib.import_module("src.clients")
+
+
+def _fake_sdk_modules():
+    """Build stand-ins for openai/httpx that record how clients are created."""
+    fake_httpx = types.ModuleType("httpx")
+    fake_httpx.Limits = Mock(name="Limits")
+
+    fake_openai = types.ModuleType("openai")
+    fake_openai.DefaultHttpxClient = Mock(name="DefaultHttpxClient")
+    fake_openai.OpenAI = Mock(name="OpenAI")
+
+    return {"httpx": fake_httpx, "openai": fake_openai}
+
+
+class ClientRegistryTests(unittest.TestCase):
+    def setUp(self):
+        clients.close_clients()
+        self.addCleanup(clients.close_clients)
+        self.modules = _fake_sdk_modules()
+        patcher = patch.dict(sys.modules, self.modules)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_openai_client_is_built_once_on_the_shared_pool(self):
+        first = clients.get_openai_client()
+        second = clients.get_openai_client()
+
+        fake_openai = self.modules["openai"]
+        self.assertIs(first, second)
+        fake_openai.DefaultHttpxClient.assert_called_once()
+        fake_openai.OpenAI.assert_called_once()
+        self.assertIs(
+            fake_openai.OpenAI.call_args.kwargs["http_client"],
+            clients.get_http_client(),
+        )
+
+    def test_http_client_keeps_sdk_defaults_and_sets_pool_limits(self):
+        clients.get_http_client()
+
+        call_kwargs = self.modules["openai"].DefaultHttpxClient.call_args.kwargs
+        self.assertEqual(set(call_kwargs), {"limits"})
+        self.modules["httpx"].Limits.assert_called_once_with(
+            max_connections=clients.config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=clients.config.HTTP_MAX_KEEPALIVE,
+        )
+
+    def test_close_clients_closes_pool_and_forgets_clients(self):
+        http_client = clients.get_http_client()
+        clients.get_openai_client()
+
+        clients.close_clients()
+
+        http_client.close.assert_called_once()
+        clients.get_openai_client()
+        self.assertEqual(self.modules["openai"].OpenAI.call_count, 2)
+        self.assertEqual(self.modules["openai"].DefaultHttpxClient.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
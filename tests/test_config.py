@@ -0,0 +1,55 @@
+import importlib
+import os
+import sys
+import types
+import unittest
+from unittest.mock import Mock, patch
+
+
+config_module = importlib.import_module("src.config")
+
+
+class ConfigTests(unittest.TestCase):
+    def setUp(self):
+        fake_dotenv = types.ModuleType("dotenv")
+        fake_dotenv.load_dotenv = Mock(name="load_dotenv")
+        self.load_dotenv = fake_dotenv.load_dotenv
+        patchers = [
+            patch.dict(sys.modules, {"dotenv": fake_dotenv}),
+            patch.object(config_module, "_env_loaded", False),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_dotenv_is_loaded_once_on_first_access(self):
+        cfg = config_module.Config()
+        self.load_dotenv.assert_not_called()
+
+        cfg.LLM_MODEL
+        cfg.TOPK_VEC
+        self.load_dotenv.assert_called_once()
+
+    def test_settings_are_read_from_environment_and_cast(self):
+        with patch.dict(os.environ, {"TOPK_VEC": "7", "LLM_MODEL": "test-model"}):
+            cfg = config_module.Config()
+            self.assertEqual(cfg.TOPK_VEC, 7)
+            self.assertEqual(cfg.LLM_MODEL, "test-model")
+
+    def test_settings_can_be_overridden_by_assignment(self):
+        cfg = config_module.Config()
+        cfg.TOPK_VEC = 5
+
+        self.assertEqual(cfg.TOPK_VEC, 5)
+        self.assertNotEqual(config_module.Config().TOPK_VEC, 5)
+
+    def test_value_is_cached_after_first_access(self):
+        cfg = config_module.Config()
+        with patch.dict(os.environ, {"FINAL_EVIDENCE": "3"}):
+            self.assertEqual(cfg.FINAL_EVIDENCE, 3)
+        with patch.dict(os.environ, {"FINAL_EVIDENCE": "4"}):
+            self.assertEqual(cfg.FINAL_EVIDENCE, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import importlib
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+db = importlib.import_module("src.db")
+
+
+class CollectionDdlTests(unittest.TestCase):
+    def test_collection_ddl_creates_partition_and_hnsw_index(self):
+        statements = db.collection_ddl("parkett")
+
+        self.assertEqual(
+            statements,
+            [
+                "CREATE TABLE IF NOT EXISTS chunks_parkett "
+                "PARTITION OF chunks FOR VALUES IN ('parkett')",
+                "CREATE INDEX IF NOT EXISTS chunks_parkett_embedding_idx "
+                "ON chunks_parkett USING hnsw (embedding vector_cosine_ops)",
+            ],
+        )
+
+    def test_collection_ddl_rejects_unsafe_names(self):
+        for name in ("Parkett", "a'b", "x; DROP TABLE chunks", "", "a" * 41):
+            with self.subTest(name=name), self.assertRaises(ValueError):
+                db.collection_ddl(name)
+
+    def test_ensure_collection_executes_ddl_and_commits(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value
+
+        with patch("src.db.get_connection", return_value=conn):
+            db.ensure_collection("parkett")
+
+        executed = [call.args[0] for call in cur.execute.call_args_list]
+        self.assertEqual(executed, db.collection_ddl("parkett"))
+        conn.commit.assert_called_once()
+
+    def test_missing_collections_compares_against_partitions(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [("chunks_parkett",), ("chunks_default",)]
+
+        with patch("src.db.get_connection", return_value=conn):
+            missing = db.missing_collections(["parkett", "fliesen"])
+
+        self.assertEqual(missing, ["fliesen"])
+
+
+if __name__ == "__main__":
+    unittest.main()
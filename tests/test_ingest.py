@@ -0,0 +1,70 @@
+import importlib
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+
+ingest = importlib.import_module("src.ingest")
+
+
+class IngestCollectionTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+        (self.directory / "TKB-01.pdf").write_bytes(b"%PDF-1.4")
+
+        patchers = {
+            "parse_pdf": patch(
+                "src.ingest.parse_pdf",
+                return_value=[{"page_number": 1, "text": "Spachtelmasse fuer Parkett"}],
+            ),
+            "get_embeddings": patch("src.ingest.get_embeddings", return_value=[[0.1, 0.2]]),
+            "ensure_collection": patch("src.ingest.ensure_collection"),
+            "document_exists": patch("src.ingest.document_exists", return_value=False),
+            "insert_document": patch("src.ingest.insert_document", return_value=42),
+            "insert_chunks": patch("src.ingest.insert_chunks"),
+            "stdout": patch("sys.stdout", new_callable=StringIO),
+        }
+        self.mocks = {}
+        for name, patcher in patchers.items():
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_ingest_directory_writes_into_requested_collection(self):
+        ingest.ingest_directory(str(self.directory), collection="parkett")
+
+        self.mocks["ensure_collection"].assert_called_once_with("parkett")
+        self.mocks["document_exists"].assert_called_once_with("TKB-01.pdf", "parkett")
+        self.mocks["insert_document"].assert_called_once_with("TKB-01.pdf", "parkett")
+
+        doc_id, chunks, collection = self.mocks["insert_chunks"].call_args.args
+        self.assertEqual((doc_id, collection), (42, "parkett"))
+        self.assertEqual(chunks[0]["embedding"], [0.1, 0.2])
+
+    def test_ingest_directory_defaults_to_default_collection(self):
+        ingest.ingest_directory(str(self.directory))
+
+        default = ingest.config.DEFAULT_COLLECTION
+        self.mocks["ensure_collection"].assert_called_once_with(default)
+        self.mocks["insert_document"].assert_called_once_with("TKB-01.pdf", default)
+
+    def test_existing_document_is_skipped_within_its_collection(self):
+        self.mocks["document_exists"].return_value = True
+
+        ingest.ingest_directory(str(self.directory), collection="parkett")
+
+        self.mocks["document_exists"].assert_called_once_with("TKB-01.pdf", "parkett")
+        self.mocks["insert_document"].assert_not_called()
+
+    def test_invalid_collection_is_rejected_before_touching_the_database(self):
+        with self.assertRaises(ValueError):
+            ingest.ingest_directory(str(self.directory), collection="Bad Name")
+
+        self.mocks["ensure_collection"].assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
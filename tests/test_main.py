@@ -0,0 +1,80 @@
+import importlib
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+
+main = importlib.import_module("main")
+config = importlib.import_module("src.config").config
+
+
+def _run(*argv):
+    with patch.object(sys, "argv", ["main.py", *argv]), patch("sys.stdout", new_callable=StringIO):
+        main.main()
+
+
+class ParseCollectionsTests(unittest.TestCase):
+    def test_splits_collections_from_remaining_args(self):
+        collections, rest = main._parse_collections(
+            ["pdfs", "--collection", "parkett", "-f"], main.INGEST_USAGE
+        )
+
+        self.assertEqual(collections, ["parkett"])
+        self.assertEqual(rest, ["pdfs", "-f"])
+
+    def test_accepts_comma_separated_and_repeated_collections(self):
+        collections, rest = main._parse_collections(
+            ["--collection", "a, b,", "--collection", "c"], main.CHAT_USAGE
+        )
+
+        self.assertEqual(collections, ["a", "b", "c"])
+        self.assertEqual(rest, [])
+
+    def test_missing_collection_value_exits(self):
+        with patch("sys.stdout", new_callable=StringIO), self.assertRaises(SystemExit):
+            main._parse_collections(["--collection"], main.CHAT_USAGE)
+
+    def test_short_alias_is_not_accepted(self):
+        collections, rest = main._parse_collections(["-c", "a"], main.CHAT_USAGE)
+
+        self.assertEqual(collections, [])
+        self.assertEqual(rest, ["-c", "a"])
+
+
+class IngestCommandTests(unittest.TestCase):
+    def test_path_is_found_regardless_of_flag_position(self):
+        with patch("src.ingest.ingest_directory") as ingest_mock:
+            _run("ingest", "-f", "pdfs", "--collection", "parkett")
+
+        ingest_mock.assert_called_once_with("pdfs", force=True, collection="parkett")
+
+    def test_rejects_more_than_one_path(self):
+        with patch("src.ingest.ingest_directory") as ingest_mock, self.assertRaises(SystemExit):
+            _run("ingest", "pdfs", "more_pdfs")
+
+        ingest_mock.assert_not_called()
+
+
+class ChatCommandTests(unittest.TestCase):
+    def test_unknown_collection_exits_before_chat_starts(self):
+        with patch("src.db.missing_collections", return_value=["typo"]), patch(
+            "src.chat.chat_loop"
+        ) as loop_mock, self.assertRaises(SystemExit):
+            _run("chat", "--collection", "parkett,typo")
+
+        loop_mock.assert_not_called()
+
+    def test_defaults_to_default_collection(self):
+        with patch("src.db.missing_collections", return_value=[]) as missing_mock, patch(
+            "src.chat.chat_loop"
+        ) as loop_mock:
+            _run("chat")
+
+        default = [config.DEFAULT_COLLECTION]
+        missing_mock.assert_called_once_with(default)
+        loop_mock.assert_called_once_with(collections=default)
+
+
+if __name__ == "__main__":
+    unittest.main()
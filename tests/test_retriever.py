@@ -0,0 +1,76 @@
+import importlib
+import threading
+import unittest
+from unittest.mock import patch
+
+
+retriever = importlib.import_module("src.retriever")
+
+
+def _hit(filename: str, similarity: float) -> dict:
+    return {"content": filename, "page_number": 1, "filename": filename, "similarity": similarity}
+
+
+class RetrieveCollectionTests(unittest.TestCase):
+    def test_retrieve_defaults_to_default_collection(self):
+        with patch("src.retriever.get_query_embedding", return_value=[0.1]), patch(
+            "src.retriever.search_similar", return_value=[_hit("A.pdf", 0.9)]
+        ) as search_mock:
+            results = retriever.retrieve("Frage", top_k=5)
+
+        search_mock.assert_called_once_with([0.1], retriever.config.DEFAULT_COLLECTION, top_k=5)
+        self.assertEqual([r["filename"] for r in results], ["A.pdf"])
+
+    def test_retrieve_merges_collections_by_similarity_and_truncates(self):
+        hits = {
+            "parkett": [_hit("P1.pdf", 0.95), _hit("P2.pdf", 0.40)],
+            "fliesen": [_hit("F1.pdf", 0.80), _hit("F2.pdf", 0.70)],
+        }
+
+        with patch("src.retriever.get_query_embedding", return_value=[0.1]), patch(
+            "src.retriever.search_similar",
+            side_effect=lambda emb, collection, top_k: hits[collection],
+        ):
+            results = retriever.retrieve("Frage", top_k=3, collections=["parkett", "fliesen"])
+
+        self.assertEqual([r["filename"] for r in results], ["P1.pdf", "F1.pdf", "F2.pdf"])
+
+    def test_search_collections_runs_searches_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _search(emb, collection, top_k):
+            # Both searches must be in flight at once to pass the barrier.
+            barrier.wait()
+            return [_hit(f"{collection}.pdf", 0.5)]
+
+        with patch("src.retriever.search_similar", side_effect=_search):
+            results = retriever.search_collections([0.1], ["a", "b"], top_k=5)
+
+        self.assertEqual(sorted(r["filename"] for r in results), ["a.pdf", "b.pdf"])
+
+    def test_retrieve_deduplicates_and_rejects_invalid_collections(self):
+        with patch("src.retriever.get_query_embedding", return_value=[0.1]), patch(
+            "src.retriever.search_similar", return_value=[]
+        ) as search_mock:
+            retriever.retrieve("Frage", top_k=5, collections=["parkett", "parkett"])
+            search_mock.assert_called_once_with([0.1], "parkett", top_k=5)
+
+            with self.assertRaises(ValueError):
+                retriever.retrieve("Frage", collections=["chunks; DROP TABLE"])
+
+
+class FormatContextTests(unittest.TestCase):
+    def test_format_context_prefixes_collection_when_requested(self):
+        results = [
+            {"filename": "A.pdf", "page_number": 2, "content": "Text", "collection": "parkett"},
+        ]
+
+        self.assertIn("[Quelle 1: A.pdf, Seite 2]", retriever.format_context(results))
+        self.assertIn(
+            "[Quelle 1: parkett/A.pdf, Seite 2]",
+            retriever.format_context(results, show_collection=True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported once a command actually needs them.
+HEAVY_MODULES = (
+    "openai",
+    "httpx",
+    "llama_parse",
+    "dotenv",
+    "psycopg2",
+    "pgvector",
+)
+
+STARTUP_IMPORTS = "import main, src.chat, src.clients, src.config, src.db, src.ingest, src.retriever"
+
+# Generous upper bound for importing the CLI and all pipeline modules.
+MAX_IMPORT_SECONDS = 0.5
+
+
+def _write_sentinels(directory: Path):
+    """Shadow every heavy module with a package that fails when imported."""
+    for name in HEAVY_MODULES:
+        package = directory / name
+        package.mkdir()
+        (package / "__init__.py").write_text(
+            f"raise ImportError('{name} imported at startup')\n"
+        )
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Return cumulative import times in us from `-X importtime` output.
+
+    Nested imports keep the indentation `-X importtime` gives them, so top-level
+    entries are the ones whose name has no leading whitespace.
+    """
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            timings[name[1:]] = int(cumulative)
+    return timings
+
+
+class StartupImportTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as sentinel_dir:
+            _write_sentinels(Path(sentinel_dir))
+            env = dict(os.environ, PYTHONPATH=sentinel_dir)
+            cls.proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", STARTUP_IMPORTS],
+                cwd=REPO_ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+        cls.timings = _parse_importtime(cls.proc.stderr)
+
+    def test_startup_does_not_import_heavy_dependencies(self):
+        # Sentinels raise on import, so an eager import fails the subprocess
+        # even when the real packages are not installed.
+        self.assertEqual(self.proc.returncode, 0, self.proc.stderr[-2000:])
+        self.assertIn("main", self.timings)
+
+        loaded_heavy = sorted(
+            name.strip() for name in self.timings
+            if name.strip().split(".")[0] in HEAVY_MODULES
+        )
+        self.assertEqual(loaded_heavy, [])
+
+    def test_startup_imports_quickly(self):
+        self.assertEqual(self.proc.returncode, 0, self.proc.stderr[-2000:])
+
+        total_us = sum(
+            cumulative for name, cumulative in self.timings.items()
+            if name == "main" or name.split(".")[0] == "src"
+        )
+        self.assertLess(total_us / 1_000_000, MAX_IMPORT_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()